@@ -32,8 +32,9 @@ Core features
     * Color legend: Baseline=gray, Control=green, A=red, B=blue.
     * Region of Interest (ROI) crop on a frozen multi-monitor capture or an
       opened image.
-    * "Save Annotated" grabs the exact canvas region from the screen so the
-      saved PNG matches what you see, with no extra padding.
+    * "Save Annotated" re-renders the current canvas view offscreen, so the
+      saved PNG has the same guides, labels, and overlay with no extra padding
+      and the window does not need to be visible.
     * Optional axis calibration: click your 100% (or any tick) and enter its value.
       Then the overlay shows Baseline-normalized percentages for Control/A/B.
       If no axis tick is set, the tool safely auto-scales to avoid division by zero
@@ -52,6 +53,9 @@ Notes
     * On macOS you may need to grant screen recording permissions to Python for
       both mss and PIL.ImageGrab to capture the screen. I haven't really tested 
       it there since I don't own a mac. Feel free to yell at me on github.
+    * Saved label text is drawn with a TrueType font, so it can differ slightly
+      from Tk's on-screen font. If the offscreen render fails, Save falls back to
+      grabbing the canvas region from the screen and says so in the status bar.
     * Percent calculations are only defined when the relevant heights exist and
       denominators are nonzero. Otherwise the display shows "NA".
     * Baseline-normalized percentages require a scale (height of Baseline->AxisTick).
@@ -63,10 +67,18 @@ __version__ = "6.1.1"
 #TODO:
 # make a utils.py or otherwise segment this code so its more manageable.
 # I got way used to doing things all in one file then splitting later.
+import base64
+import io
+import math
+import os
 import sys
+import threading
 import time
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Dict, Optional, Tuple
+from xml.sax.saxutils import escape
 
 try:
     import tkinter as tk
@@ -77,18 +89,77 @@ except Exception as e:
 
 try:
     # PIL imports used throughout the app
-    from PIL import Image, ImageTk, ImageDraw, ImageFont, ImageGrab
+    from PIL import Image, ImageTk, ImageDraw, ImageFont
 except Exception as e:
     print("This program requires Pillow. Install with: pip install pillow", file=sys.stderr)
     raise
 
-# Detect whether mss is available for screen capture.
-# mss is preferred over PIL.ImageGrab for cross-platform reliability.
-MSS_AVAILABLE = True
+# Detect whether pic-scale is available for display resampling.
+# It runs LANCZOS in a SIMD kernel with a worker pool; Pillow is the fallback.
+PIC_SCALE_AVAILABLE = True
 try:
-    import mss
+    from pic_scale import Resampling, Plan
 except Exception:
-    MSS_AVAILABLE = False
+    PIC_SCALE_AVAILABLE = False
+
+# OpenCV (with NumPy) writes PNGs straight from mss's BGRA buffer. It is a heavy
+# import only needed when saving, so it is loaded on first use by _import_cv2().
+_cv2 = None  # module once imported, False if unavailable
+_np = None
+
+
+def _import_cv2() -> bool:
+    """Import OpenCV and NumPy on first call. Returns False if they are not installed."""
+    global _cv2, _np
+    if _cv2 is None:
+        try:
+            import cv2
+            import numpy
+        except Exception:
+            _cv2 = False
+            return False
+        _cv2, _np = cv2, numpy
+    return _cv2 is not False
+
+
+# fpng encodes PNGs several times faster than Pillow's libpng/zlib path. Like
+# OpenCV it is only needed when saving, so _import_fpng() loads it on first use.
+_fpng = None  # module once imported, False if unavailable
+
+
+def _import_fpng() -> bool:
+    """Import fpng_py on first call. Returns False if it is not installed."""
+    global _fpng
+    if _fpng is None:
+        try:
+            import fpng_py
+        except Exception:
+            _fpng = False
+            return False
+        _fpng = fpng_py
+    return _fpng is not False
+
+
+# mss is preferred over PIL.ImageGrab for screen capture (cross-platform reliability).
+# Neither is needed until the first capture, so both are imported on demand:
+# mss by _import_mss(), ImageGrab inside _grab_canvas. MSS_AVAILABLE stays None
+# until the first check.
+_mss = None
+MSS_AVAILABLE: Optional[bool] = None
+
+
+def _import_mss() -> bool:
+    """Import mss on first call. Returns False if it is not installed."""
+    global _mss, MSS_AVAILABLE
+    if MSS_AVAILABLE is None:
+        try:
+            import mss
+        except Exception:
+            MSS_AVAILABLE = False
+        else:
+            _mss, MSS_AVAILABLE = mss, True
+    return MSS_AVAILABLE
+
 
 # Guide and label colors for each point type.
 COLORS = {
@@ -99,6 +170,16 @@ COLORS = {
     "Axis":     "#FFD600",  # gold (axis calibration reference, e.g., 100%)
 }
 
+# PNG save presets mapped to (zlib level, zlib strategy) for the PNG encoder.
+# "Fast" trades a slightly larger file for a much shorter encode. Z_RLE only
+# looks for runs, which suits flat screen content: it is faster than the default
+# strategy and far smaller than Z_HUFFMAN_ONLY for annotated captures.
+SAVE_PRESETS = {
+    "Fast":     (1, zlib.Z_RLE),
+    "Balanced": (3, zlib.Z_DEFAULT_STRATEGY),
+    "Small":    (6, zlib.Z_DEFAULT_STRATEGY),  # Pillow's default
+}
+
 
 @dataclass
 class Point:
@@ -145,17 +226,46 @@ class AnnotatorApp:
       The app keeps track of a scale factor so clicks map to image coordinates.
     """
 
+    # Baseline-normalized values summarized in the title bar, in display order
+    _TITLE_KEYS = (("BaseNorm_A", "A"), ("BaseNorm_B", "B"), ("BaseNorm_Control", "Control"))
+
     def __init__(self, master: tk.Tk):
         """Build UI, initialize state, and register event handlers."""
         self.master = master
         master.title("Baseline + Control + A + B Annotator (Baseline-Normalized %)")
 
         # Working images and canvas scaling
-        self.full_capture: Optional[Image.Image] = None   # last frozen full desktop
+        # Last frozen full desktop or opened image. It is shared with self.image on
+        # load (no copy); that is safe because the working image is never modified
+        # in place, only replaced (crop/resize return new images).
+        self.full_capture: Optional[Image.Image] = None
         self.image: Optional[Image.Image] = None          # current working image (full or ROI)
         self.display_image: Optional[Image.Image] = None  # scaled image shown on canvas
         self.photo: Optional[ImageTk.PhotoImage] = None   # Tkinter wrapper for display_image
         self.display_scale: Tuple[float, float] = (1.0, 1.0)
+        self._image_item_id: Optional[int] = None  # canvas image item, repointed on rescale
+        self._scale_plan = None  # ((src_size, dst_size, mode), pic_scale.Plan) reused across resizes
+        self._use_pic_scale = PIC_SCALE_AVAILABLE  # cleared after the first pic-scale failure
+        # Scaled display images keyed by (id(working image), disp_w, disp_h).
+        # Cleared whenever the working image changes so ids cannot go stale.
+        self._scaled_cache: Dict[Tuple[int, int, int], Tuple[Image.Image, ImageTk.PhotoImage]] = {}
+
+        # Resize debouncing: <Configure> fires per pixel while dragging the window
+        self._pending_resize: Optional[str] = None        # after() id of the scheduled redraw
+        self._resize_size: Optional[Tuple[int, int]] = None   # latest requested canvas size
+        self._applied_size: Optional[Tuple[int, int]] = None  # canvas size last rendered
+        # Canvas screen geometry (rootx, rooty, width, height) for Save; None until next needed
+        self._geom: Optional[Tuple[int, int, int, int]] = None
+        self._pending_refine: Optional[str] = None        # after() id of the LANCZOS pass after a drag
+        self._display_quality: str = "best"               # filter used for the current display image
+
+        # Background worker for decoding opened images off the Tk thread
+        self._io_pool = ThreadPoolExecutor(max_workers=1)
+        # Encode + disk write for "Save Annotated" (capture itself stays on the Tk thread)
+        self._save_pool = ThreadPoolExecutor(max_workers=2)
+        # Reusable BGR frame for the OpenCV save path, one per save worker so encodes still run in parallel
+        self._frame_local = threading.local()
+        self._sct = None  # mss instance, created on first use and reused (Tk thread only)
 
         # Point registry (+ optional axis tick)
         self.points: Dict[str, Point] = {
@@ -168,7 +278,14 @@ class AnnotatorApp:
         self.axis_value: float = 100.0  # numeric value for Axis tick (default 100)
 
         self.current_mode: Optional[str] = None  # which point we are currently setting
-        self.overlay_items = []                  # canvas item ids for the overlay panel
+        self._overlay_item_id: Optional[int] = None  # single canvas image item showing the overlay panel
+        self._overlay_panel: Optional[Image.Image] = None  # overlay panel bitmap (also used for SVG export)
+        self._overlay_photo: Optional[ImageTk.PhotoImage] = None  # keeps the panel bitmap alive
+        self._overlay_font = self._load_font(("DejaVuSans.ttf", "arial.ttf", "Arial.ttf", "Helvetica.ttc"), 13)
+        self._text_probe: Optional[ImageDraw.ImageDraw] = None  # 1x1 draw context for measuring overlay text
+        # Bold face for point labels when the canvas is rendered offscreen for Save
+        self._label_font = self._load_font(("DejaVuSans-Bold.ttf", "arialbd.ttf", "Arial Bold.ttf"), 13)
+        self._last_overlay_state = None  # point coords + axis value last rendered; None forces a redraw
 
         # ROI selection state
         self.roi_start: Optional[Tuple[int, int]] = None
@@ -191,11 +308,14 @@ class AnnotatorApp:
 
         self.btn_clear = tk.Button(tb, text="Clear Marks", command=self.clear_marks)
         self.btn_save = tk.Button(tb, text="Save Annotated", command=self.save_annotated)
+        self.btn_save_svg = tk.Button(tb, text="Save SVG", command=self.save_svg)
+        self.save_preset = tk.StringVar(value="Fast")
+        self.opt_save_preset = tk.OptionMenu(tb, self.save_preset, *SAVE_PRESETS)
         self.btn_info = tk.Button(tb, text="Monitors Info", command=self.show_monitors_info)
 
         for w in [self.btn_capture_all, self.btn_open, self.btn_roi, self.btn_reset_roi,
                   self.btn_set_baseline, self.btn_set_control, self.btn_set_a, self.btn_set_b, self.btn_set_axis,
-                  self.btn_clear, self.btn_save, self.btn_info]:
+                  self.btn_clear, self.btn_save, self.opt_save_preset, self.btn_save_svg, self.btn_info]:
             w.pack(side=tk.LEFT, padx=4, pady=4)
 
         # Status line at the bottom for user guidance
@@ -206,10 +326,20 @@ class AnnotatorApp:
         self.canvas = tk.Canvas(master, background="#202020", cursor="crosshair")
         self.canvas.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
 
+        # Bound canvas methods for the per-click drawing paths (skips attribute lookups per call)
+        self._c_line = self.canvas.create_line
+        self._c_oval = self.canvas.create_oval
+        self._c_text = self.canvas.create_text
+        self._c_delete = self.canvas.delete
+        self._c_coords = self.canvas.coords
+        self._c_itemcfg = self.canvas.itemconfigure
+
         # Event bindings. add="+" ensures handlers do not overwrite each other. Previous error with handlers, watch out for add = "+" !!!
-        self.canvas.bind("<Button-1>", self.on_canvas_click, add="+")
+        # <Button-1> and <ButtonPress-1> are the same event, so one dispatcher handles both modes.
+        self.canvas.bind("<Button-1>", self._on_press, add="+")
         self.canvas.bind("<Configure>", self.on_resize, add="+")
-        self.canvas.bind("<ButtonPress-1>", self.on_roi_press, add="+")
+        # Moving the window changes the canvas' screen position without a canvas <Configure>
+        master.bind("<Configure>", self._on_window_configure, add="+")
         self.canvas.bind("<B1-Motion>", self.on_roi_drag, add="+")
         self.canvas.bind("<ButtonRelease-1>", self.on_roi_release, add="+")
 
@@ -225,19 +355,54 @@ class AnnotatorApp:
         master.bind("t", lambda e: self.set_axis_tick())
         master.bind("<Escape>", lambda e: self.set_mode(None))
 
+        # Release the screen-capture handles and worker thread on window close
+        master.protocol("WM_DELETE_WINDOW", self.on_close)
+
+    def on_close(self) -> None:
+        """Close the cached mss instance, stop the workers, and destroy the window."""
+        if self._sct is not None:
+            try:
+                self._sct.close()
+            except Exception:
+                pass
+            self._sct = None
+        self._io_pool.shutdown(wait=False)
+        self._save_pool.shutdown(wait=False)  # queued saves still finish before exit
+        self.master.destroy()
+
     # ********* Capture / Open **********
+    def _get_sct(self, refresh: bool = False):
+        """
+        Return the shared mss instance, creating it on first use.
+
+        Opening mss connects to the display server and enumerates monitors, so
+        the instance is kept for the app's lifetime. mss reads the monitor
+        layout once per instance; refresh=True reopens it to pick up changes
+        (full captures do, the fixed-region save grab does not). Only call
+        this from the Tk thread.
+        """
+        if refresh and self._sct is not None:
+            try:
+                self._sct.close()
+            except Exception:
+                pass
+            self._sct = None
+        if self._sct is None:
+            self._sct = _mss.mss()
+        return self._sct
+
     def show_monitors_info(self) -> None:
         """Display monitor geometry detected by mss for troubleshooting."""
-        if not MSS_AVAILABLE:
+        if not _import_mss():
             messagebox.showinfo("Monitors", "mss not available. pip install mss")
             return
         try:
-            with mss.mss() as sct:
-                mons = sct.monitors
-                lines = [f"Detected {len(mons)-1} monitor(s)."]
-                for idx, m in enumerate(mons):
-                    lines.append(f"Index {idx}: left={m['left']}, top={m['top']}, width={m['width']}, height={m['height']}")
-                messagebox.showinfo("Monitors", "\n".join(lines))
+            # Refresh so the report reflects the current layout
+            mons = self._get_sct(refresh=True).monitors
+            lines = [f"Detected {len(mons)-1} monitor(s)."]
+            for idx, m in enumerate(mons):
+                lines.append(f"Index {idx}: left={m['left']}, top={m['top']}, width={m['width']}, height={m['height']}")
+            messagebox.showinfo("Monitors", "\n".join(lines))
         except Exception as e:
             messagebox.showerror("Error", f"Failed to query monitors: {e}")
 
@@ -250,17 +415,19 @@ class AnnotatorApp:
         mss.monitors[0] returns a bounding box that covers all attached
         displays, which lets us handle multi-monitor setups in a single image.
         """
-        if not MSS_AVAILABLE:
+        if not _import_mss():
             messagebox.showerror("mss not available", "Install with: pip install mss")
             return
         try:
-            with mss.mss() as sct:
-                bbox = sct.monitors[0]
-                shot = sct.grab(bbox)
+            # Refresh per capture so plugged, removed, or resized monitors are picked up
+            sct = self._get_sct(refresh=True)
+            shot = sct.grab(sct.monitors[0])
         except Exception as e:
             messagebox.showerror("Error", f"Capture failed: {e}")
             return
-        img = Image.frombytes("RGB", shot.size, shot.rgb)
+        # Decode the raw BGRA buffer directly; shot.rgb would first repack it in Python.
+        # The BGRX decoder copies into Pillow's own storage, so the image outlives shot.
+        img = Image.frombuffer("RGB", shot.size, shot.raw, "raw", "BGRX", 0, 1)
         self.full_capture = img
         self.set_image(img)
         self.status.set(f"Captured all monitors: {img.size[0]} x {img.size[1]}. Select ROI or set points.")
@@ -273,59 +440,202 @@ class AnnotatorApp:
         )
         if not path:
             return
+        # Decode on the worker so large files do not freeze the UI
+        self.status.set("Loading image...")
+        future = self._io_pool.submit(self._decode_image, path)
+        self._when_done(future, self._on_image_loaded)
+
+    @staticmethod
+    def _decode_image(path: str) -> Image.Image:
+        """
+        Open and fully decode an image on the worker thread.
+
+        RGB files are kept as decoded; only other modes (RGBA, P, L, ...) pay
+        for a convert("RGB") copy.
+        """
+        img = Image.open(path)
+        if img.mode != "RGB":
+            return img.convert("RGB")
+        img.load()  # Image.open is lazy; decode here rather than on the Tk thread
+        return img
+
+    def _on_image_loaded(self, future: Future) -> None:
+        """Install a decoded image from open_image as the working image (UI thread)."""
         try:
-            img = Image.open(path).convert("RGB")
+            img = future.result()
         except Exception as e:
+            self.status.set("Open failed.")
             messagebox.showerror("Error", f"Failed to open image: {e}")
             return
-        self.full_capture = img.copy()
+        self.full_capture = img
         self.set_image(img)
         self.status.set("Image loaded. Select ROI if needed, then set points.")
 
+    def _when_done(self, future: Future, callback) -> None:
+        """
+        Poll a worker future from the Tk event loop and call callback(future)
+        on the UI thread once it has finished. Tk must not be touched from
+        worker threads, so results are always handed back this way.
+        """
+        if future.done():
+            callback(future)
+        else:
+            self.master.after(50, self._when_done, future, callback)
+
     # ******** Image / Canvas *********************
     def set_image(self, img: Image.Image) -> None:
         """
         Assign the working image and reset the canvas view.
 
         This also clears any existing marks because coordinates are with respect
-        to the current image.
+        to the current image. img is not modified, so callers may keep sharing it.
         """
         self.image = img
+        self._scaled_cache.clear()
         self.reset_canvas_image()
         self.clear_marks()
         self.status.set("Image ready.")
 
-    def reset_canvas_image(self) -> None:
+    def reset_canvas_image(self, quality: str = "best") -> None:
         """
         Fit the working image to the canvas while preserving aspect ratio,
         then redraw all overlays at the new scale.
+
+        quality="fast" resamples with BILINEAR for transient frames during a
+        window drag; quality="best" uses LANCZOS. Only "best" frames are cached.
         """
         if self.image is None:
             return
-        c_w = max(self.canvas.winfo_width(), 200)
-        c_h = max(self.canvas.winfo_height(), 200)
+        self._rebuild_scaled_image(quality)
+        self._redraw_points_and_overlay()
+
+    def _rebuild_scaled_image(self, quality: str) -> None:
+        """Resample (or fetch from cache) the display image and show it on the canvas."""
+        c_w = self.canvas.winfo_width()
+        c_h = self.canvas.winfo_height()
+        self._applied_size = (c_w, c_h)
+        c_w = max(c_w, 200)
+        c_h = max(c_h, 200)
         img_w, img_h = self.image.size
-        scale = min(c_w / img_w, c_h / img_h)
+        fit_w, fit_h = c_w / img_w, c_h / img_h
+        scale = fit_w if fit_w < fit_h else fit_h
         disp_w = max(1, int(img_w * scale))
         disp_h = max(1, int(img_h * scale))
         self.display_scale = (disp_w / img_w, disp_h / img_h)
-        self.display_image = self.image.resize((disp_w, disp_h), Image.LANCZOS)
-        self.photo = ImageTk.PhotoImage(self.display_image)
-
-        self.canvas.delete("all")
-        self.canvas.create_image(0, 0, anchor="nw", image=self.photo)
+        key = (id(self.image), disp_w, disp_h)
+        cached = self._scaled_cache.get(key)
+        if cached is None:
+            scaled = self._scale_image((disp_w, disp_h), scale, quality)
+            cached = (scaled, ImageTk.PhotoImage(scaled))
+            if quality == "best":
+                if len(self._scaled_cache) >= 4:
+                    # Keep only a few recent sizes; each entry holds a full display bitmap
+                    self._scaled_cache.pop(next(iter(self._scaled_cache)))
+                self._scaled_cache[key] = cached
+        else:
+            quality = "best"  # the cache only holds LANCZOS frames
+        self._display_quality = quality
+        self.display_image, self.photo = cached
+
+        if self._image_item_id is None:
+            # Created with the first image, before any point/overlay/ROI item can exist,
+            # so it already sits at the bottom of the stacking order.
+            self._image_item_id = self.canvas.create_image(0, 0, anchor="nw", image=self.photo, tags=("image",))
+        else:
+            self._c_itemcfg(self._image_item_id, image=self.photo)
 
+    def _redraw_points_and_overlay(self) -> None:
+        """Redraw point graphics and the overlay panel at the current display scale."""
         # Redraw existing points at the new scale
+        draw = self.draw_point
         for name, pt in self.points.items():
-            if pt.xy is not None:
-                self.draw_point(name, pt.xy, redraw=True)
+            xy = pt.xy
+            if xy is not None:
+                draw(name, xy, redraw=True)
 
+        # The canvas width may have changed, so the overlay is always repositioned
+        self._last_overlay_state = None
         self.update_metrics_overlay()
 
+    def _scale_image(self, size: Tuple[int, int], scale: float, quality: str) -> Image.Image:
+        """
+        Resample the working image to the given display size.
+
+        When shrinking by more than 2x, the image is first box-reduced by an
+        integer factor (Image.reduce, a cheap C pass) so the final filter only
+        touches the already shrunk pixels. "fast" then uses BILINEAR; "best"
+        uses LANCZOS through pic-scale when installed, with its Plan
+        (precomputed filter weights) cached per (source size, display size,
+        mode). Falls back to Pillow otherwise; the first pic-scale failure
+        is reported and disables it for the session.
+        """
+        src = self.image
+        if scale < 0.5:
+            src = src.reduce(int(1.0 / scale))
+        if quality == "fast":
+            return src.resize(size, Image.BILINEAR)
+        if self._use_pic_scale:
+            try:
+                key = (src.size, size, src.mode)
+                if self._scale_plan is None or self._scale_plan[0] != key:
+                    self._scale_plan = (key, Plan(src.size, size, Resampling.LANCZOS, src.mode, workers=0))
+                scaled = self._scale_plan[1].resize(src)
+                # ImageTk.PhotoImage needs a PIL image of the requested size
+                if not isinstance(scaled, Image.Image) or scaled.size != size:
+                    raise TypeError(f"resize returned {type(scaled).__name__}, expected a {size} PIL image")
+                return scaled
+            except Exception as e:
+                # Disable pic-scale rather than retrying (and hiding) the same failure every frame
+                self._use_pic_scale = False
+                self._scale_plan = None
+                print(f"pic-scale failed, using Pillow for display scaling: {e}", file=sys.stderr)
+        return src.resize(size, Image.LANCZOS)
+
     def on_resize(self, event) -> None:
-        """When the canvas resizes, recompute scaling and redraw."""
-        if self.image is not None:
-            self.reset_canvas_image()
+        """
+        When the canvas resizes, schedule a rescale and redraw.
+
+        Events are coalesced with an after() timer so a window drag renders
+        once at the settled size instead of once per intermediate size. The
+        redraw uses the fast filter; a LANCZOS pass follows once the drag
+        has been idle for 200 ms.
+        """
+        self._geom = None
+        if self.image is None:
+            return
+        self._resize_size = (event.width, event.height)
+        if self._pending_resize is not None:
+            self.master.after_cancel(self._pending_resize)
+        if self._pending_refine is not None:
+            self.master.after_cancel(self._pending_refine)
+        self._pending_resize = self.master.after(60, self._do_resize)
+        self._pending_refine = self.master.after(200, self._refine_display)
+
+    def _on_window_configure(self, event) -> None:
+        """Forget the cached canvas geometry when the top-level window moves or resizes."""
+        if event.widget is self.master:
+            self._geom = None
+
+    def _canvas_geometry(self) -> Tuple[int, int, int, int]:
+        """Return (rootx, rooty, width, height) of the canvas, cached until it moves or resizes."""
+        if self._geom is None:
+            c = self.canvas
+            self._geom = (c.winfo_rootx(), c.winfo_rooty(), c.winfo_width(), c.winfo_height())
+        return self._geom
+
+    def _do_resize(self) -> None:
+        """Run the deferred redraw if the canvas size actually changed."""
+        self._pending_resize = None
+        if self.image is None or self._resize_size == self._applied_size:
+            return
+        self.reset_canvas_image(quality="fast")
+
+    def _refine_display(self) -> None:
+        """Replace a fast-filtered display image with a LANCZOS one."""
+        self._pending_refine = None
+        if self.image is None or self._display_quality == "best":
+            return
+        self.reset_canvas_image(quality="best")
 
     def canvas_to_image_xy(self, x: int, y: int) -> Tuple[int, int]:
         """
@@ -366,6 +676,13 @@ class AnnotatorApp:
             self.roi_rect_canvas_id = None
         self.roi_start = None
 
+    def _on_press(self, event) -> None:
+        """Route a left-button press to ROI selection or point placement."""
+        if self.current_mode == "ROI":
+            self.on_roi_press(event)
+        else:
+            self.on_canvas_click(event)
+
     def on_roi_press(self, event) -> None:
         """Start point for ROI drag if we are in ROI mode."""
         if self.current_mode != "ROI" or self.image is None:
@@ -389,7 +706,7 @@ class AnnotatorApp:
                 x0, y0, x1, y1, outline="#00FF00", dash=(6, 4), width=2
             )
         else:
-            self.canvas.coords(self.roi_rect_canvas_id, x0, y0, x1, y1)
+            self._c_coords(self.roi_rect_canvas_id, x0, y0, x1, y1)
 
     def on_roi_release(self, event) -> None:
         """Finalize ROI and crop the working image."""
@@ -426,8 +743,11 @@ class AnnotatorApp:
             self.roi_start = None
             return
 
-        # Crop, clear marks(coordinates are no longer valid!!!!!!!!!!), and redraw
+        # Crop, clear marks(coordinates are no longer valid!!!!!!!!!!), and redraw.
+        # Image.crop copies only the ROI pixels; a NumPy view would first need
+        # np.asarray(self.image), which copies the whole frame, so PIL stays.
         self.image = self.image.crop((ix0, iy0, ix1, iy1))
+        self._scaled_cache.clear()
         self.clear_marks()
         self.reset_canvas_image()
         if self.roi_rect_canvas_id is not None:
@@ -479,6 +799,8 @@ class AnnotatorApp:
         self.status.set(f"{label} set at {img_xy}.")
         self.current_mode = None
         self.update_metrics_overlay()
+        # Flush the point and overlay changes to the screen in one pass
+        self.canvas.update_idletasks()
 
     def _color_for(self, name: str) -> str:
         """Resolve the configured color for a point name."""
@@ -493,61 +815,57 @@ class AnnotatorApp:
         pt = self.points[name]
 
         # Remove prior canvas items for this point (if any)
+        delete = self._c_delete
         for attr in ("line_id", "dot_id", "label_id"):
             item = getattr(pt, attr)
             if item is not None:
                 try:
-                    self.canvas.delete(item)
+                    delete(item)
                 except Exception:
                     pass
                 setattr(pt, attr, None)
 
-        can_x, can_y = self.image_to_canvas_xy(*img_xy)
-        width = self.display_image.size[0] if self.display_image is not None else self.canvas.winfo_width()
+        # Same mapping as image_to_canvas_xy, inlined for this per-point path
+        sx, sy = self.display_scale
+        can_x, can_y = int(img_xy[0] * sx), int(img_xy[1] * sy)
+        display_image = self.display_image
+        width = display_image.size[0] if display_image is not None else self.canvas.winfo_width()
         color = self._color_for(name)
 
         # Horizontal dotted guide across the full canvas width
-        pt.line_id = self.canvas.create_line(0, can_y, width, can_y, dash=(6, 4), width=2, fill=color)
+        pt.line_id = self._c_line(0, can_y, width, can_y, dash=(6, 4), width=2, fill=color,
+                                  tags=("point",))
 
         # Small marker dot at the exact click location and a short label
         r = 4
-        pt.dot_id = self.canvas.create_oval(can_x - r, can_y - r, can_x + r, can_y + r, outline=color, width=2)
+        pt.dot_id = self._c_oval(can_x - r, can_y - r, can_x + r, can_y + r, outline=color, width=2,
+                                 tags=("point",))
 
         label_text = f"{name} ({img_xy[0]}, {img_xy[1]})"
         if name == "Axis":
             label_text = f"Axis {self.axis_value:g} ({img_xy[0]}, {img_xy[1]})"
-        pt.label_id = self.canvas.create_text(
+        pt.label_id = self._c_text(
             can_x + 8, can_y - 10, text=label_text,
-            anchor="w", fill=color, font=("TkDefaultFont", 10, "bold")
+            anchor="w", fill=color, font=("TkDefaultFont", 10, "bold"), tags=("point",)
         )
 
-        # Ensure overlay stays visible above lines/labels
-        for oid in self.overlay_items:
-            self.canvas.tag_raise(oid)
+        # Ensure overlay stays visible above lines/labels (one Tcl call for the whole group)
+        self.canvas.tag_raise("overlay")
 
     # ************ Metrics ********************
     def clear_marks(self) -> None:
         """Remove all point graphics and forget their coordinates."""
+        self.canvas.delete("point")
         for pt in self.points.values():
-            for attr in ("line_id", "dot_id", "label_id"):
-                item = getattr(pt, attr)
-                if item is not None:
-                    try:
-                        self.canvas.delete(item)
-                    except Exception:
-                        pass
-                    setattr(pt, attr, None)
+            pt.line_id = pt.dot_id = pt.label_id = None
             pt.xy = None
         self.clear_overlay_text()
 
     def clear_overlay_text(self) -> None:
         """Erase the overlay panel and its text items."""
-        for item in self.overlay_items:
-            try:
-                self.canvas.delete(item)
-            except Exception:
-                pass
-        self.overlay_items = []
+        self.canvas.delete("overlay")
+        self._overlay_item_id = None
+        self._last_overlay_state = None
 
     def compute_metrics(self) -> Dict[str, Optional[float]]:
         """
@@ -566,51 +884,38 @@ class AnnotatorApp:
         base_y = baseline[1] if baseline is not None else None
         axis_y = axis_pt[1] if axis_pt is not None else None
 
-        def height(y_top: int) -> Optional[float]:
-            if base_y is None:
-                return None
-            return float(base_y - y_top)
-
         # Heights will be None until both Baseline and the specific point exist
-        hA = height(A[1]) if A is not None else None
-        hB = height(B[1]) if B is not None else None
-        hC = height(control[1]) if control is not None else None
+        hA = float(base_y - A[1]) if base_y is not None and A is not None else None
+        hB = float(base_y - B[1]) if base_y is not None and B is not None else None
+        hC = float(base_y - control[1]) if base_y is not None and control is not None else None
 
         # Axis span in pixels (Baseline -> Axis). Could be zero if placed at same y.
         hAxis = None
         if base_y is not None and axis_y is not None:
-            try:
-                span = float(base_y - axis_y)
-                hAxis = span if span != 0 else None
-            except Exception:
-                hAxis = None
+            span = float(base_y - axis_y)
+            hAxis = span if span != 0 else None
 
         # Auto scale fallback (avoids division by zero; "scale both baseline and markers").
-        auto_used = False
-        if hAxis is None:
+        auto_used = hAxis is None
+        if auto_used:
             # choose the largest available height as the scale; if none exist, use 1.0
-            candidates = [v for v in (hA, hB, hC) if v is not None]
-            if candidates:
-                hAxis = max(abs(v) for v in candidates)
-                auto_used = True
-            else:
-                hAxis = 1.0
-                auto_used = True
+            candidates = [abs(v) for v in (hA, hB, hC) if v is not None]
+            hAxis = max(candidates) if candidates else 1.0
 
         def pct(n, d):
-            """Safe percent helper that returns None if inputs are missing or invalid."""
-            try:
-                if n is None or d is None or d == 0:
-                    return None
-                return 100.0 * n / d
-            except Exception:
-                return None
+            """Percent helper that returns None if inputs are missing or the denominator is zero."""
+            return None if n is None or not d else 100.0 * n / d
 
-        # Baseline-normalized percentages using the chosen scale
-        def base_norm(v_height: Optional[float]) -> Optional[float]:
-            if v_height is None or hAxis is None:
-                return None
-            return (v_height / hAxis) * float(self.axis_value)
+        # Differences between heights, None unless both heights exist
+        dAB = hA - hB if hA is not None and hB is not None else None
+        dAC = hA - hC if hA is not None and hC is not None else None
+        dBC = hB - hC if hB is not None and hC is not None else None
+        # Reverse differences are computed directly; negating a 0.0 would print "-0.00"
+        dBA = hB - hA if hA is not None and hB is not None else None
+        dCA = hC - hA if hA is not None and hC is not None else None
+        dCB = hC - hB if hB is not None and hC is not None else None
+
+        axis_value = float(self.axis_value)
 
         m: Dict[str, Optional[float]] = {
             # Heights
@@ -624,26 +929,26 @@ class AnnotatorApp:
             # A <-> B
             "A_as_pct_of_B": pct(hA, hB),
             "B_as_pct_of_A": pct(hB, hA),
-            "delta_A_vs_B_pct": pct(None if hA is None or hB is None else hA - hB, hB),
-            "delta_B_vs_A_pct": pct(None if hA is None or hB is None else hB - hA, hA),
+            "delta_A_vs_B_pct": pct(dAB, hB),
+            "delta_B_vs_A_pct": pct(dBA, hA),
 
             # A <-> Control
             "A_as_pct_of_Control": pct(hA, hC),
             "Control_as_pct_of_A": pct(hC, hA),
-            "delta_A_vs_Control_pct": pct(None if hA is None or hC is None else hA - hC, hC),
-            "delta_Control_vs_A_pct": pct(None if hA is None or hC is None else hC - hA, hA),
+            "delta_A_vs_Control_pct": pct(dAC, hC),
+            "delta_Control_vs_A_pct": pct(dCA, hA),
 
             # B <-> Control
             "B_as_pct_of_Control": pct(hB, hC),
             "Control_as_pct_of_B": pct(hC, hB),
-            "delta_B_vs_Control_pct": pct(None if hB is None or hC is None else hB - hC, hC),
-            "delta_Control_vs_B_pct": pct(None if hB is None or hC is None else hC - hB, hB),
-
-            # Baseline-normalized (calibrated) values
-            "BaseNorm_Control": base_norm(hC),
-            "BaseNorm_A": base_norm(hA),
-            "BaseNorm_B": base_norm(hB),
-            "Axis_Value": float(self.axis_value) if self.axis_value is not None else None,
+            "delta_B_vs_Control_pct": pct(dBC, hC),
+            "delta_Control_vs_B_pct": pct(dCB, hB),
+
+            # Baseline-normalized (calibrated) values; need a nonzero scale (all-zero heights give NA)
+            "BaseNorm_Control": (hC / hAxis) * axis_value if hC is not None and hAxis else None,
+            "BaseNorm_A": (hA / hAxis) * axis_value if hA is not None and hAxis else None,
+            "BaseNorm_B": (hB / hAxis) * axis_value if hB is not None and hAxis else None,
+            "Axis_Value": axis_value,
         }
         return m
 
@@ -651,8 +956,15 @@ class AnnotatorApp:
         """
         Draw the overlay panel in the upper right. It always appears, and
         fills progressively with "NA" for values that are not yet available.
+
+        The panel is rendered into a single bitmap and shown as one canvas
+        image item, which is created once and then updated in place. Nothing
+        is redrawn if no point and no axis value changed since the last call.
         """
-        self.clear_overlay_text()
+        state = tuple(p.xy for p in self.points.values()) + (self.axis_value,)
+        if state == self._last_overlay_state:
+            return
+        self._last_overlay_state = state
         m = self.compute_metrics()
 
         def fmt(v):
@@ -687,58 +999,86 @@ class AnnotatorApp:
             f"  B vs Control: {fmt(m['delta_B_vs_Control_pct'])} %",
             f"  Control vs B: {fmt(m['delta_Control_vs_B_pct'])} %",
         ]
-        text = "\n".join(lines)
-
-        pad = 8
-        w = self.canvas.winfo_width()
-        x_text, y_text = w - 10, 10  # anchor to upper right
-        # Create text first so we can size the background rectangle to fit
-        t = self.canvas.create_text(x_text, y_text, anchor="ne", text=text, fill="#EAF2F8", font=("TkDefaultFont", 10))
-        bbox = self.canvas.bbox(t)
-        if bbox:
-            x1, y1, x2, y2 = bbox
-            rect = self.canvas.create_rectangle(x1 - pad, y1 - pad, x2 + pad, y2 + pad,
-                                                fill="#111111", outline="#666666")
-            self.canvas.tag_lower(rect, t)
-            self.overlay_items.append(rect)
-        self.overlay_items.append(t)
+        panel = self._render_overlay_bitmap(lines)
+        photo = ImageTk.PhotoImage(panel)
+        # Canvas width as of the last rescale; avoids a winfo round-trip per click
+        w = self._applied_size[0] if self._applied_size is not None else self.canvas.winfo_width()
+        x_img, y_img = w - 2, 2  # anchor to upper right
+        if self._overlay_item_id is None:
+            self._overlay_item_id = self.canvas.create_image(x_img, y_img, anchor="ne", image=photo,
+                                                             tags=("overlay",))
+        else:
+            self._c_itemcfg(self._overlay_item_id, image=photo)
+            self._c_coords(self._overlay_item_id, x_img, y_img)
+        # Swap the reference only after the item points at the new bitmap
+        self._overlay_panel, self._overlay_photo = panel, photo
 
         # Keep overlay above all point graphics
-        for oid in self.overlay_items:
-            self.canvas.tag_raise(oid)
+        self.canvas.tag_raise("overlay")
 
         # Title bar summary with any available baseline-normalized values
-        title_bits = []
-        for key, label in (("BaseNorm_A", "A"), ("BaseNorm_B", "B"), ("BaseNorm_Control", "Control")):
-            v = m.get(key)
-            if v is not None:
-                title_bits.append(f"{label} {v:.1f}")
-        self.master.title(" | ".join(title_bits) if title_bits else "Baseline + Control + A + B Annotator")
+        title = " | ".join(f"{label} {m[key]:.1f}" for key, label in self._TITLE_KEYS if m[key] is not None)
+        self.master.title(title or "Baseline + Control + A + B Annotator")
+
+    @staticmethod
+    def _load_font(names, size: int) -> ImageFont.ImageFont:
+        """Return the first TrueType font in names that loads, or Pillow's default."""
+        for name in names:
+            try:
+                return ImageFont.truetype(name, size)
+            except Exception:
+                continue
+        return ImageFont.load_default()
+
+    def _render_overlay_bitmap(self, lines) -> Image.Image:
+        """
+        Render the overlay panel (semi-transparent background, border, text)
+        into one RGBA image sized to fit the text.
+        """
+        text = "\n".join(lines)
+        pad = 8
+        if self._text_probe is None:
+            self._text_probe = ImageDraw.Draw(Image.new("RGBA", (1, 1)))
+        x1, y1, x2, y2 = self._text_probe.multiline_textbbox((0, 0), text, font=self._overlay_font)
+        # Snap the text box to whole pixels once; Image.new needs ints and bbox may be fractional
+        left, top = math.floor(x1), math.floor(y1)
+        w = math.ceil(x2) - left + 2 * pad
+        h = math.ceil(y2) - top + 2 * pad
+        panel = Image.new("RGBA", (w, h), (0, 0, 0, 180))
+        draw = ImageDraw.Draw(panel)
+        draw.rectangle((0, 0, w - 1, h - 1), outline="#666666")
+        draw.multiline_text((pad - left, pad - top), text, fill="#EAF2F8", font=self._overlay_font)
+        return panel
 
     # **** Save (capture current canvas) ********
+    # Above this many canvas items the offscreen render is skipped in favor of a screen grab
+    _RENDER_ITEM_LIMIT = 500
+
     def save_annotated(self) -> None:
         """
-        Capture the canvas area from the screen as it currently appears
-        and save it to a PNG. This preserves the exact layout with no gaps.
+        Save the canvas view as it currently appears to a PNG, with no gaps.
+
+        The view is normally re-rendered offscreen from the canvas items
+        (_render_to_image), which works even when the window is covered.
+        Canvases with more than _RENDER_ITEM_LIMIT items are grabbed from
+        the screen instead. Either way the pixels are collected here on the
+        Tk thread; encoding and writing run on the save worker.
         """
-        try:
-            x0 = self.canvas.winfo_rootx()
-            y0 = self.canvas.winfo_rooty()
-            w = self.canvas.winfo_width()
-            h = self.canvas.winfo_height()
-
-            # Prefer mss for cross-platform capture
-            if MSS_AVAILABLE:
-                with mss.mss() as sct:
-                    shot = sct.grab({"left": x0, "top": y0, "width": w, "height": h})
-                    img = Image.frombytes("RGB", shot.size, shot.rgb)
-            else:
-                # Fallback to PIL.ImageGrab on platforms where it is allowed
-                bbox = (x0, y0, x0 + w, y0 + h)
-                img = ImageGrab.grab(bbox=bbox).convert("RGB")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to capture canvas: {e}")
-            return
+        shot = img = None
+        note = ""
+        if len(self.canvas.find_all()) <= self._RENDER_ITEM_LIMIT:
+            try:
+                img = self._render_to_image()
+            except Exception as e:
+                # Fall back to grabbing the screen, but say why so a render bug is not silent
+                note = f"offscreen render failed ({e}); used a screen grab"
+                print(f"Save: {note}", file=sys.stderr)
+        if img is None:
+            try:
+                shot, img = self._grab_canvas()
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to capture canvas: {e}")
+                return
 
         path = filedialog.asksaveasfilename(
             title="Save annotated view",
@@ -748,11 +1088,250 @@ class AnnotatorApp:
         )
         if not path:
             return
+        preset = self.save_preset.get()  # Tk variables are read on the Tk thread only
+        if shot is not None:
+            future = self._save_pool.submit(self._write_shot, shot, path, preset)
+        else:
+            future = self._save_pool.submit(self._write_image, img, path, preset)
+        self.status.set(f"Saving ({note})..." if note else "Saving...")
+        self._when_done(future, lambda f: self._on_saved(f, path, note))
+
+    def _on_saved(self, future: Future, path: str, note: str = "") -> None:
+        """Report the result of a background save (UI thread), with any fallback note."""
         try:
-            img.save(path)
-            messagebox.showinfo("Saved", f"Annotated view saved to:\n{path}")
+            future.result()
         except Exception as e:
+            self.status.set("Save failed.")
             messagebox.showerror("Error", f"Failed to save image: {e}")
+            return
+        self.status.set(f"Saved ({note})." if note else "Saved.")
+        messagebox.showinfo("Saved", f"Annotated view saved to:\n{path}")
+
+    def _grab_canvas(self):
+        """
+        Grab the canvas region from the screen. Returns (shot, None) with the
+        raw mss screenshot (decoded only if the writer needs a PIL image), or
+        (None, img) from the PIL.ImageGrab fallback.
+        """
+        x0, y0, w, h = self._canvas_geometry()
+        # Prefer mss for cross-platform capture
+        if _import_mss():
+            return self._get_sct().grab({"left": x0, "top": y0, "width": w, "height": h}), None
+        # Fallback to PIL.ImageGrab on platforms where it is allowed
+        from PIL import ImageGrab
+        img = ImageGrab.grab(bbox=(x0, y0, x0 + w, y0 + h))
+        if img.mode != "RGB":  # already RGB on Windows; skip the extra full-image pass
+            img = img.convert("RGB")
+        return None, img
+
+    def _render_to_image(self) -> Image.Image:
+        """
+        Rasterize the canvas items (bottom to top) into an RGB image the size
+        of the canvas, without reading the screen. Mirrors _canvas_to_svg.
+        """
+        c = self.canvas
+        w, h = c.winfo_width(), c.winfo_height()
+        out = Image.new("RGB", (w, h), c.cget("background"))
+        draw = ImageDraw.Draw(out)
+        bitmaps = {self._image_item_id: self.display_image, self._overlay_item_id: self._overlay_panel}
+        for item in c.find_all():
+            kind = c.type(item)
+            xy = c.coords(item)
+            if kind == "image":
+                img = bitmaps.get(item)
+                bbox = c.bbox(item)
+                if img is None or not bbox:
+                    continue
+                out.paste(img, (int(bbox[0]), int(bbox[1])), img if img.mode == "RGBA" else None)
+            elif kind == "line":
+                width = int(float(c.itemcget(item, "width")))
+                self._draw_dashed(draw, xy[:4], c.itemcget(item, "dash"), c.itemcget(item, "fill"), width)
+            elif kind == "oval":
+                width = int(float(c.itemcget(item, "width")))
+                draw.ellipse(xy, outline=c.itemcget(item, "outline"), width=width)
+            elif kind == "rectangle":
+                width = int(float(c.itemcget(item, "width")))
+                draw.rectangle(xy, fill=c.itemcget(item, "fill") or None,
+                               outline=c.itemcget(item, "outline") or None, width=width)
+            elif kind == "text":
+                # Point labels are anchored "w" (left, vertically centered) in a bold face
+                draw.text((xy[0], xy[1]), c.itemcget(item, "text"), fill=c.itemcget(item, "fill"),
+                          font=self._label_font, anchor="lm")
+        return out
+
+    @staticmethod
+    def _draw_dashed(draw: ImageDraw.ImageDraw, xy, dash: str, fill: str, width: int) -> None:
+        """Draw a straight line with a Tk dash pattern such as "6 4" (ImageDraw has no dashes)."""
+        x1, y1, x2, y2 = xy
+        pattern = [int(float(v)) for v in dash.split()] if dash else []
+        length = ((x2 - x1) ** 2 + (y2 - y1) ** 2) ** 0.5
+        if not pattern or length == 0:
+            draw.line((x1, y1, x2, y2), fill=fill, width=width)
+            return
+        ux, uy = (x2 - x1) / length, (y2 - y1) / length
+        pos, i = 0.0, 0
+        while pos < length:
+            end = min(pos + pattern[i % len(pattern)], length)
+            if i % 2 == 0:  # even entries are drawn, odd entries are gaps
+                draw.line((x1 + ux * pos, y1 + uy * pos, x1 + ux * end, y1 + uy * end), fill=fill, width=width)
+            pos, i = end, i + 1
+
+    def save_svg(self) -> None:
+        """
+        Save the current canvas view as SVG.
+
+        The view is serialized from the canvas items rather than grabbed from
+        the screen, so it works while the window is covered and the guides,
+        dots, and labels stay vector. The display image and overlay panel are
+        embedded as PNG.
+        """
+        if self.image is None:
+            self.status.set("Capture or open an image first.")
+            return
+        path = filedialog.asksaveasfilename(
+            title="Save annotated view as SVG",
+            defaultextension=".svg",
+            initialfile=f"annotated_view_{int(time.time())}.svg",
+            filetypes=[("SVG image", "*.svg"), ("All files", "*.*")],
+        )
+        if not path:
+            return
+        try:
+            svg = self._canvas_to_svg()
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(svg)
+            messagebox.showinfo("Saved", f"Annotated view saved to:\n{path}")
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to save SVG: {e}")
+
+    def _canvas_to_svg(self) -> str:
+        """Serialize the canvas items (bottom to top) into an SVG document."""
+        c = self.canvas
+        w, h = c.winfo_width(), c.winfo_height()
+        # Canvas image items only hold PhotoImages, so map them back to their PIL sources
+        bitmaps = {self._image_item_id: self.display_image, self._overlay_item_id: self._overlay_panel}
+
+        def png_uri(img: Image.Image) -> str:
+            buf = io.BytesIO()
+            img.save(buf, "PNG", compress_level=1)
+            return "data:image/png;base64," + base64.b64encode(buf.getvalue()).decode("ascii")
+
+        def stroke(item) -> str:
+            dash = c.itemcget(item, "dash")
+            dash_attr = f' stroke-dasharray="{dash.replace(" ", ",")}"' if dash else ""
+            return f'stroke-width="{c.itemcget(item, "width")}"{dash_attr}'
+
+        out = [
+            f'<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink" '
+            f'width="{w}" height="{h}" viewBox="0 0 {w} {h}">',
+            f'<rect width="{w}" height="{h}" fill="{c.cget("background")}"/>',
+        ]
+        for item in c.find_all():
+            kind = c.type(item)
+            xy = c.coords(item)
+            if kind == "image":
+                img = bitmaps.get(item)
+                bbox = c.bbox(item)
+                if img is None or not bbox:
+                    continue
+                # SVG 2 readers use href, SVG 1.1 readers only xlink:href
+                uri = png_uri(img)
+                out.append(f'<image x="{bbox[0]}" y="{bbox[1]}" width="{img.width}" height="{img.height}" '
+                           f'href="{uri}" xlink:href="{uri}"/>')
+            elif kind == "line":
+                x1, y1, x2, y2 = xy[:4]
+                out.append(f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" '
+                           f'stroke="{c.itemcget(item, "fill")}" {stroke(item)}/>')
+            elif kind == "oval":
+                x1, y1, x2, y2 = xy
+                out.append(f'<ellipse cx="{(x1 + x2) / 2}" cy="{(y1 + y2) / 2}" rx="{(x2 - x1) / 2}" '
+                           f'ry="{(y2 - y1) / 2}" fill="none" stroke="{c.itemcget(item, "outline")}" {stroke(item)}/>')
+            elif kind == "rectangle":
+                x1, y1, x2, y2 = xy
+                fill = c.itemcget(item, "fill") or "none"
+                out.append(f'<rect x="{x1}" y="{y1}" width="{x2 - x1}" height="{y2 - y1}" fill="{fill}" '
+                           f'stroke="{c.itemcget(item, "outline")}" {stroke(item)}/>')
+            elif kind == "text":
+                # Point labels are anchored "w" and drawn in the bold default font
+                out.append(f'<text x="{xy[0]}" y="{xy[1]}" fill="{c.itemcget(item, "fill")}" '
+                           f'font-family="sans-serif" font-size="13" font-weight="bold" '
+                           f'dominant-baseline="middle">{escape(c.itemcget(item, "text"))}</text>')
+        out.append("</svg>")
+        return "\n".join(out)
+
+    def _write_shot(self, shot, path: str, preset: str) -> None:
+        """
+        Write an mss screenshot to path.
+
+        PNGs are encoded by OpenCV directly from the BGRA buffer when it is
+        installed (its BGR channel order needs no swap), unless the "Fast"
+        preset can use fpng. Everything else is decoded to a PIL image and
+        passed to _write_image. Runs on the save worker.
+        """
+        use_fpng = preset == "Fast" and _import_fpng()
+        if path.lower().endswith(".png") and not use_fpng and _import_cv2():
+            w, h = shot.size
+            bgra = _np.frombuffer(shot.raw, dtype=_np.uint8).reshape(h, w, 4)
+            level, strategy = SAVE_PRESETS.get(preset, SAVE_PRESETS["Fast"])
+            # OpenCV's IMWRITE_PNG_STRATEGY_* values are zlib's strategy constants
+            params = [_cv2.IMWRITE_PNG_COMPRESSION, level, _cv2.IMWRITE_PNG_STRATEGY, strategy]
+            # Reuse this worker's contiguous BGR frame; reallocate only when the canvas size changes
+            frame = getattr(self._frame_local, "buf", None)
+            if frame is None or frame.shape != (h, w, 3):
+                frame = self._frame_local.buf = _np.empty((h, w, 3), dtype=_np.uint8)
+            _np.copyto(frame, bgra[..., :3])
+            ok, encoded = _cv2.imencode(".png", frame, params)
+            if ok:
+                self._write_file(path, encoded)
+                return
+        # Same BGRX decode as capture_all_monitors; avoids mss's Python-level .rgb repack
+        self._write_image(Image.frombuffer("RGB", shot.size, shot.raw, "raw", "BGRX", 0, 1), path, preset)
+
+    def _write_image(self, img: Image.Image, path: str, preset: str) -> None:
+        """
+        Write img to path using the selected save preset for PNG output.
+
+        PNGs are encoded by Pillow with the preset's zlib settings (see SAVE_PRESETS);
+        the "Fast" preset uses fpng instead when it is installed. Other
+        extensions keep Pillow's format detection. Runs on the save worker.
+        """
+        if not path.lower().endswith(".png"):
+            img.save(path)
+            return
+        if preset == "Fast" and _import_fpng():
+            w, h = img.size
+            try:
+                # Encode in memory (raises on failure) so the write matches the other paths
+                encoded = _fpng.fpng_encode_image_to_memory(img.tobytes(), w, h, 3)
+            except Exception:
+                encoded = None  # fall through to Pillow
+            if encoded:
+                self._write_file(path, encoded)
+                return
+        buf = io.BytesIO()
+        level, strategy = SAVE_PRESETS.get(preset, SAVE_PRESETS["Fast"])
+        img.save(buf, "PNG", compress_level=level, compress_type=strategy, optimize=False)
+        self._write_file(path, buf.getbuffer())
+
+    @staticmethod
+    def _write_file(path: str, data) -> None:
+        """
+        Write an encoded image to disk in a single write() call.
+
+        On POSIX the file is synced and its pages are then dropped from the
+        page cache (POSIX_FADV_DONTNEED), since a saved screenshot is not read
+        back. DONTNEED skips dirty pages, hence the fdatasync first; this runs
+        on the save worker, so the wait does not block the UI.
+        """
+        with open(path, "wb") as f:
+            f.write(data)
+            f.flush()
+            if hasattr(os, "posix_fadvise"):
+                try:
+                    os.fdatasync(f.fileno())
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+                except OSError:
+                    pass  # advisory only
 
 
 #Dupes from previous iterations